@@ -16,6 +16,7 @@ Usage:
     claude-accounts install                          Install aliases in shell
     claude-accounts export                           Export accounts JSON
     claude-accounts import <file>                    Import accounts JSON
+    claude-accounts daemon                           Unix-socket query daemon
     claude-accounts serve [--port 5111]              Start web UI
 """
 
@@ -23,6 +24,7 @@ import sys
 import os
 import json
 import shlex
+import shutil
 import argparse
 import subprocess
 import time
@@ -31,33 +33,45 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent))
 import db
 
+# Resolved once so launch doesn't re-walk $PATH (one stat per PATH entry)
+CLAUDE_BIN = shutil.which("claude")
+
+# Paths computed once at import — Path.home() and the venv stat were
+# re-evaluated on every call that needed them.
+HOME = Path.home()
+PROJECT_DIR = Path(__file__).resolve().parent
+_VENV_PYTHON = PROJECT_DIR / "venv" / "bin" / "python"
+PYTHON_BIN = str(_VENV_PYTHON) if _VENV_PYTHON.exists() else "python3"
+CLI_PATH = str(PROJECT_DIR / "cli.py")
+
 
 def cmd_add(args):
-    name = args.name.lower().strip().replace(" ", "-")
+    name = db.normalize_name(args.name)
     if len(name) < 2:
         print("✗ Nom trop court (min 2 car.)")
         sys.exit(1)
-    if db.get_account_by_name(name):
-        print(f"✗ '{name}' existe déjà")
-        sys.exit(1)
 
     aid = f"acc_{name}_{os.urandom(4).hex()}"
 
-    if args.oauth:
-        db.add_account(aid, name, "oauth")
-        print(f"✓ Compte OAuth '{name}' créé")
-        print(f"\n  Prochaine étape — capturer les tokens :")
-        print(f"  claude-accounts login {name}")
-    else:
-        api_key = args.key
-        if not api_key:
-            import getpass
-            api_key = getpass.getpass("Clé API (sk-ant-...): ")
-        if not api_key:
-            print("✗ Clé API requise")
-            sys.exit(1)
-        db.add_account(aid, name, "api_key", api_key=api_key)
-        print(f"✓ Compte '{name}' ajouté (API Key)")
+    try:
+        if args.oauth:
+            db.add_account(aid, name, "oauth")
+            print(f"✓ Compte OAuth '{name}' créé")
+            print(f"\n  Prochaine étape — capturer les tokens :")
+            print(f"  claude-accounts login {name}")
+        else:
+            api_key = args.key
+            if not api_key:
+                import getpass
+                api_key = getpass.getpass("Clé API (sk-ant-...): ")
+            if not api_key:
+                print("✗ Clé API requise")
+                sys.exit(1)
+            db.add_account(aid, name, "api_key", api_key=api_key)
+            print(f"✓ Compte '{name}' ajouté (API Key)")
+    except ValueError:
+        print(f"✗ '{name}' existe déjà")
+        sys.exit(1)
 
     print(f"  Alias : claude-{name}")
 
@@ -83,7 +97,7 @@ def cmd_login(args):
         sys.exit(1)
 
     # Check if credentials file exists
-    cred_path = Path.home() / ".claude" / ".credentials.json"
+    cred_path = HOME / ".claude" / ".credentials.json"
     if not cred_path.exists():
         print(f"\n✗ Fichier {cred_path} introuvable.")
         print(f"  Lance d'abord : claude")
@@ -206,7 +220,23 @@ def cmd_launch(args):
     cmd = ["claude"] + claude_args
 
     print(f"  ▶ Claude → {args.name} ({list(env_vars.keys())[0]})")
-    os.execvpe("claude", cmd, env)
+
+    if getattr(args, "no_exec", False):
+        # Keep this process alive (wrappers/IDE integrations): spawn claude
+        # as a child via posix_spawn (no fork, no page-table copy) and
+        # mirror its exit code.
+        claude_bin = CLAUDE_BIN if CLAUDE_BIN and os.path.exists(CLAUDE_BIN) else shutil.which("claude")
+        if not claude_bin:
+            print("✗ Binaire 'claude' introuvable dans le PATH")
+            sys.exit(1)
+        pid = os.posix_spawn(claude_bin, cmd, env)
+        _, status = os.waitpid(pid, 0)
+        sys.exit(os.waitstatus_to_exitcode(status))
+
+    if CLAUDE_BIN and os.path.exists(CLAUDE_BIN):
+        os.execve(CLAUDE_BIN, cmd, env)
+    else:
+        os.execvpe("claude", cmd, env)
 
 
 def cmd_remove(args):
@@ -224,16 +254,38 @@ def cmd_remove(args):
 
 
 def _cli_paths():
-    """Return (python_path, cli_path) using venv if available."""
-    project_dir = Path(__file__).resolve().parent
-    venv_python = project_dir / "venv" / "bin" / "python"
-    cli_path = project_dir / "cli.py"
-    py = str(venv_python) if venv_python.exists() else "python3"
-    return py, str(cli_path)
+    """Return (python_path, cli_path) — constants resolved at import."""
+    return PYTHON_BIN, CLI_PATH
+
+
+# Precompiled alias templates — formatted per account instead of
+# assembling each line from scratch.
+_ALIASES_HEADER = """\
+#!/usr/bin/env bash
+# Claude Accounts Manager
+
+# CLI wrapper (auto-activates venv)
+claude-accounts() {{
+    "{py}" "{cli}" "$@"
+}}
+"""
+_ALIAS_LINE = "alias claude-{name}='{env_key}={env_val} claude'"
+
+
+def _alias_lines(accounts):
+    """Yield one alias line per account (accounts from list_accounts_with_secrets)."""
+    for acc in accounts:
+        try:
+            env_vars = db.get_launch_env_readonly(acc)
+            (env_key, env_val), = env_vars.items()
+            yield _ALIAS_LINE.format(name=acc["name"], env_key=env_key,
+                                     env_val=shlex.quote(env_val))
+        except Exception as e:
+            yield f"# {acc['name']}: {e}"
 
 
 def cmd_aliases(args):
-    accounts = db.list_accounts()
+    accounts = db.list_accounts_with_secrets()
     if not accounts:
         print("# Aucun compte")
         return
@@ -249,50 +301,28 @@ def cmd_aliases(args):
     print("}")
     print()
 
-    for acc in accounts:
-        try:
-            env_vars = db.get_launch_env(acc["id"])
-            parts = [f'{k}={shlex.quote(v)}' for k, v in env_vars.items()]
-            parts.append("claude")
-            print(f"alias claude-{acc['name']}='{' '.join(parts)}'")
-        except Exception as e:
-            print(f"# {acc['name']}: {e}")
+    for line in _alias_lines(accounts):
+        print(line)
 
 
 def cmd_install(args):
-    accounts = db.list_accounts()
-    aliases_dir = Path.home() / ".claude-accounts"
+    accounts = db.list_accounts_with_secrets()
+    aliases_dir = HOME / ".claude-accounts"
     aliases_dir.mkdir(parents=True, exist_ok=True)
     aliases_file = aliases_dir / "aliases.sh"
 
-    py, cli_path = _cli_paths()
+    body = (_ALIASES_HEADER.format(py=PYTHON_BIN, cli=CLI_PATH)
+            + "\n".join(_alias_lines(accounts)) + "\n")
 
-    lines = [
-        "#!/usr/bin/env bash",
-        "# Claude Accounts Manager",
-        "",
-        "# CLI wrapper (auto-activates venv)",
-        "claude-accounts() {",
-        f'    "{py}" "{cli_path}" "$@"',
-        "}",
-        "",
-    ]
-    for acc in accounts:
-        try:
-            env_vars = db.get_launch_env(acc["id"])
-            parts = [f'{k}={shlex.quote(v)}' for k, v in env_vars.items()]
-            parts.append("claude")
-            lines.append(f"alias claude-{acc['name']}='{' '.join(parts)}'")
-        except Exception:
-            pass
-
-    aliases_file.write_text("\n".join(lines) + "\n")
-    os.chmod(str(aliases_file), 0o600)
+    # O_CREAT with 0600 — no separate chmod syscall, never world-readable
+    fd = os.open(str(aliases_file), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "w") as f:
+        f.write(body)
     print(f"  ✓ Aliases → {aliases_file}")
 
     source_line = f'source "{aliases_file}"'
     for rc in [".bashrc", ".zshrc"]:
-        rc_path = Path.home() / rc
+        rc_path = HOME / rc
         if rc_path.exists() and source_line not in rc_path.read_text():
             with open(rc_path, "a") as f:
                 f.write(f"\n# Claude Accounts Manager\n{source_line}\n")
@@ -302,7 +332,14 @@ def cmd_install(args):
 
 
 def cmd_export(args):
-    print(json.dumps(db.export_all(), indent=2))
+    # Stream entry by entry — no full list + full string in memory.
+    out = sys.stdout
+    out.write("[\n")
+    for i, entry in enumerate(db.iter_export()):
+        if i:
+            out.write(",\n")
+        out.write("  " + json.dumps(entry))
+    out.write("\n]\n")
 
 
 def cmd_import(args):
@@ -312,6 +349,75 @@ def cmd_import(args):
     print(f"  ✓ {count} compte(s) importé(s)")
 
 
+def cmd_daemon(args):
+    """
+    Serve read-mostly queries over a Unix socket from a warm process.
+    Scripts that poll (list/status in a loop) pay Python startup + argparse
+    + cipher init per invocation; the daemon pays it once. Protocol: one
+    JSON object per line, e.g. {"cmd": "status", "name": "perso"}.
+    """
+    import socket
+
+    sock_path = db.DB_DIR / "daemon.sock"
+    if sock_path.exists():
+        sock_path.unlink()
+
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(str(sock_path))
+    os.chmod(str(sock_path), 0o600)
+    server.listen(8)
+    print(f"  ▶ Daemon → {sock_path}")
+    print(f"  Exemple : echo '{{\"cmd\":\"list\"}}' | nc -U {sock_path}")
+
+    def handle(req: dict) -> dict:
+        cmd = req.get("cmd", "")
+        if cmd == "list":
+            return {"accounts": db.list_accounts()}
+        if cmd in ("status", "env"):
+            acc = db.get_account_by_name(req.get("name", ""))
+            if not acc:
+                return {"error": f"'{req.get('name')}' introuvable"}
+            if cmd == "status":
+                return db.get_token_status(acc["id"])
+            try:
+                return {"env": db.get_launch_env(acc["id"])}
+            except ValueError as e:
+                return {"error": str(e)}
+        return {"error": f"Commande inconnue : {cmd}"}
+
+    try:
+        while True:
+            client, _ = server.accept()
+            try:
+                # The accept loop is single-client: without a timeout, one
+                # caller that connects and stalls wedges the daemon for
+                # everyone else.
+                client.settimeout(5.0)
+                try:
+                    data = client.makefile().readline()
+                    req = json.loads(data)
+                    if not isinstance(req, dict):
+                        # Valid JSON but not an object ('5', '[1]', '\"x\"')
+                        # would blow up on req.get and kill the loop.
+                        raise TypeError
+                    resp = handle(req)
+                except socket.timeout:
+                    resp = {"error": "Délai dépassé"}
+                except (json.JSONDecodeError, UnicodeDecodeError, TypeError):
+                    resp = {"error": "JSON invalide"}
+                client.sendall((json.dumps(resp) + "\n").encode())
+            except OSError:
+                pass  # client gone mid-reply — next caller isn't affected
+            finally:
+                client.close()
+    except KeyboardInterrupt:
+        print("\n  Daemon arrêté")
+    finally:
+        server.close()
+        if sock_path.exists():
+            sock_path.unlink()
+
+
 def cmd_serve(args):
     port = args.port or 5111
     os.environ["PORT"] = str(port)
@@ -346,6 +452,8 @@ def main():
 
     s = sub.add_parser("launch", aliases=["run"], help="Lancer claude avec un compte")
     s.add_argument("name")
+    s.add_argument("--no-exec", action="store_true",
+                   help="Lancer claude en sous-processus au lieu de remplacer le processus")
     s.add_argument("claude_args", nargs="*")
 
     s = sub.add_parser("remove", aliases=["rm"])
@@ -358,6 +466,8 @@ def main():
     s = sub.add_parser("import")
     s.add_argument("file")
 
+    sub.add_parser("daemon", help="Serveur Unix socket pour requêtes scriptées")
+
     s = sub.add_parser("serve", help="Lancer l'interface web")
     s.add_argument("--port", "-p", type=int, default=5111)
     s.add_argument("--remote", action="store_true", help="Bind 0.0.0.0 (acces distant)")
@@ -376,7 +486,7 @@ def main():
         "remove": cmd_remove, "rm": cmd_remove,
         "aliases": cmd_aliases, "install": cmd_install,
         "export": cmd_export, "import": cmd_import,
-        "serve": cmd_serve,
+        "daemon": cmd_daemon, "serve": cmd_serve,
     }
 
     fn = cmds.get(args.cmd)
@@ -15,12 +15,35 @@ API keys:
 
 import sqlite3
 import os
+import re
 import json
 import time
 import tempfile
+import threading
+import weakref
+import atexit
 from pathlib import Path
-from cryptography.fernet import Fernet
-import requests
+
+# cryptography and requests are imported lazily: they cost tens of ms at
+# startup and commands like `list` (with key_last6) or `serve` startup
+# don't always need them.
+
+# orjson is optional: when installed, credential-file (de)serialization
+# goes straight to/from bytes without the str round trip.
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
+
+def _json_loads(raw: bytes):
+    return _orjson.loads(raw) if _orjson is not None else json.loads(raw)
+
+
+def _json_dump_bytes(data) -> bytes:
+    if _orjson is not None:
+        return _orjson.dumps(data)
+    return json.dumps(data, separators=(",", ":")).encode()
 
 DB_DIR = Path.home() / ".claude-accounts"
 DB_PATH = DB_DIR / "accounts.db"
@@ -29,40 +52,172 @@ KEY_PATH = DB_DIR / ".key"
 
 # ── Encryption ────────────────────────────────────────────────────────────────
 
+_CIPHER = None
+_CIPHER_LOCK = threading.Lock()
+_KEY_BYTES = None
+
+
+def _load_key_bytes() -> bytes:
+    # In-memory snapshot of the key — touched on disk exactly once per
+    # process, so cipher (re)construction never stats the filesystem.
+    global _KEY_BYTES
+    if _KEY_BYTES is None:
+        DB_DIR.mkdir(parents=True, exist_ok=True)
+        if KEY_PATH.exists():
+            _KEY_BYTES = KEY_PATH.read_bytes()
+        else:
+            from cryptography.fernet import Fernet
+            _KEY_BYTES = Fernet.generate_key()
+            KEY_PATH.write_bytes(_KEY_BYTES)
+            os.chmod(str(KEY_PATH), 0o600)
+    return _KEY_BYTES
+
+
 def _get_cipher():
-    DB_DIR.mkdir(parents=True, exist_ok=True)
-    if KEY_PATH.exists():
-        key = KEY_PATH.read_bytes()
-    else:
-        key = Fernet.generate_key()
-        KEY_PATH.write_bytes(key)
-        os.chmod(str(KEY_PATH), 0o600)
-    return Fernet(key)
+    # Cached singleton — building a Fernet re-reads the key file and redoes
+    # the key schedule, which used to happen once per encrypted field.
+    global _CIPHER
+    if _CIPHER is None:
+        with _CIPHER_LOCK:
+            if _CIPHER is None:
+                from cryptography.fernet import Fernet
+                _CIPHER = Fernet(_load_key_bytes())
+    return _CIPHER
+
+
+# New values use AES-256-GCM (single fused pass, AES-NI + CLMUL) instead of
+# Fernet's HMAC-SHA256 + AES-CBC + double base64. Tokens are versioned with
+# a "v2:" prefix; unprefixed values are legacy Fernet and still decrypt.
+_AESGCM = None
+_V2_PREFIX = "v2:"
+
+
+def _get_aesgcm():
+    global _AESGCM
+    if _AESGCM is None:
+        with _CIPHER_LOCK:
+            if _AESGCM is None:
+                from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+                from base64 import urlsafe_b64decode
+                # The Fernet key file is urlsafe-b64 of 32 raw bytes —
+                # reuse those bytes directly as the AES-256 key.
+                _AESGCM = AESGCM(urlsafe_b64decode(_load_key_bytes()))
+    return _AESGCM
 
 
 def _encrypt(value: str) -> str:
     if not value:
         return ""
-    return _get_cipher().encrypt(value.encode()).decode()
+    from base64 import urlsafe_b64encode
+    nonce = os.urandom(12)
+    ct = _get_aesgcm().encrypt(nonce, value.encode(), None)
+    return _V2_PREFIX + urlsafe_b64encode(nonce + ct).decode()
+
+
+def _encrypt_many(*values: str) -> list[str]:
+    # Encrypt several fields with the cipher and base64 encoder resolved
+    # once — inserts encrypt three fields back to back.
+    gcm = _get_aesgcm()
+    from base64 import urlsafe_b64encode
+    out = []
+    for value in values:
+        if not value:
+            out.append("")
+            continue
+        nonce = os.urandom(12)
+        ct = gcm.encrypt(nonce, value.encode(), None)
+        out.append(_V2_PREFIX + urlsafe_b64encode(nonce + ct).decode())
+    return out
 
 
 def _decrypt(token: str) -> str:
     if not token:
         return ""
+    if token.startswith(_V2_PREFIX):
+        from base64 import urlsafe_b64decode
+        raw = urlsafe_b64decode(token[len(_V2_PREFIX):])
+        return _get_aesgcm().decrypt(raw[:12], raw[12:], None).decode()
+    # Legacy Fernet value (pre-v2 databases)
     return _get_cipher().decrypt(token.encode()).decode()
 
 
 # ── Database ──────────────────────────────────────────────────────────────────
 
+_LOCAL = threading.local()
+
+
+class _ConnHandle:
+    """Per-thread owner of a cached connection.
+
+    Under Werkzeug's threaded server (one thread per request) the
+    thread-local slot is the last strong reference to this handle; when
+    the thread dies the handle is collected and closes its connection —
+    releasing its fds and any locks it held — instead of leaking one
+    connection per request thread until process exit. sqlite3.Connection
+    itself can't be weak-referenced, hence the wrapper.
+    """
+    __slots__ = ("conn", "__weakref__")
+
+    def __init__(self, conn):
+        self.conn = conn
+
+    def close(self):
+        try:
+            self.conn.close()
+        except sqlite3.Error:
+            pass
+
+    __del__ = close
+
+
+# Weak registry of live handles, for the atexit sweep only.
+_ALL_CONNS = weakref.WeakSet()
+_ALL_CONNS_LOCK = threading.Lock()
+
+
 def get_db():
-    DB_DIR.mkdir(parents=True, exist_ok=True)
-    conn = sqlite3.connect(str(DB_PATH))
-    conn.row_factory = sqlite3.Row
-    conn.execute("PRAGMA journal_mode=WAL")
-    return conn
+    """Return this thread's cached connection, creating it on first use.
+
+    Opening a fresh connection per call reparses PRAGMAs and rebuilds the
+    page cache every time; one connection per thread amortizes all of that.
+    Callers must NOT close the returned connection.
+    """
+    handle = getattr(_LOCAL, "handle", None)
+    if handle is None:
+        DB_DIR.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(DB_PATH), cached_statements=256)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA cache_size=-64000")
+        conn.execute("PRAGMA busy_timeout=5000")
+        handle = _ConnHandle(conn)
+        _LOCAL.handle = handle
+        with _ALL_CONNS_LOCK:
+            _ALL_CONNS.add(handle)
+    return handle.conn
+
+
+def _close_all():
+    with _ALL_CONNS_LOCK:
+        for handle in list(_ALL_CONNS):
+            handle.close()
+        _ALL_CONNS.clear()
+
+
+atexit.register(_close_all)
+
+
+_INIT_DONE = False
 
 
 def init_db():
+    # Idempotent and once per process: the DDL/migration round trips are
+    # paid at import time, never on a request path.
+    global _INIT_DONE
+    if _INIT_DONE:
+        return
     conn = get_db()
     conn.executescript("""
         CREATE TABLE IF NOT EXISTS accounts (
@@ -83,19 +238,38 @@ def init_db():
             key TEXT PRIMARY KEY,
             value TEXT NOT NULL
         );
+        CREATE INDEX IF NOT EXISTS idx_accounts_created_at ON accounts(created_at);
+        -- Dropped: idx_accounts_name duplicated the implicit index from
+        -- UNIQUE(name); idx_accounts_expires served a query that no
+        -- longer exists. Both cost per-write maintenance for nothing.
+        DROP INDEX IF EXISTS idx_accounts_name;
+        DROP INDEX IF EXISTS idx_accounts_expires;
     """)
+    # Migration: plaintext last-6 chars of the active credential, so listing
+    # accounts never needs to decrypt (the mask is not sensitive on its own).
+    cols = [r[1] for r in conn.execute("PRAGMA table_info(accounts)")]
+    if "key_last6" not in cols:
+        conn.execute("ALTER TABLE accounts ADD COLUMN key_last6 TEXT NOT NULL DEFAULT ''")
     conn.commit()
-    conn.close()
     os.chmod(str(DB_PATH), 0o600)
+    _INIT_DONE = True
 
 
 # ── Auth ─────────────────────────────────────────────────────────────────────
 
+_SETUP_DONE = False
+
+
 def is_setup_done() -> bool:
+    # Setup is a one-way transition — once the hash exists it never goes
+    # away, so a positive answer can be latched for the process lifetime.
+    global _SETUP_DONE
+    if _SETUP_DONE:
+        return True
     conn = get_db()
     row = conn.execute("SELECT value FROM settings WHERE key = 'password_hash'").fetchone()
-    conn.close()
-    return row is not None
+    _SETUP_DONE = row is not None
+    return _SETUP_DONE
 
 
 def setup_admin(password: str) -> str:
@@ -110,7 +284,6 @@ def setup_admin(password: str) -> str:
     conn.execute("INSERT OR REPLACE INTO settings (key, value) VALUES ('password_hash', ?)", (pw_hash,))
     conn.execute("INSERT OR REPLACE INTO settings (key, value) VALUES ('api_token_hash', ?)", (token_hash,))
     conn.commit()
-    conn.close()
     return raw_token
 
 
@@ -118,7 +291,6 @@ def verify_password(password: str) -> bool:
     from werkzeug.security import check_password_hash
     conn = get_db()
     row = conn.execute("SELECT value FROM settings WHERE key = 'password_hash'").fetchone()
-    conn.close()
     if not row:
         return False
     return check_password_hash(row["value"], password)
@@ -128,7 +300,6 @@ def verify_api_token(token: str) -> bool:
     import hashlib
     conn = get_db()
     row = conn.execute("SELECT value FROM settings WHERE key = 'api_token_hash'").fetchone()
-    conn.close()
     if not row:
         return False
     return hashlib.sha256(token.encode()).hexdigest() == row["value"]
@@ -142,38 +313,105 @@ def change_password(old_password: str, new_password: str) -> bool:
     conn = get_db()
     conn.execute("UPDATE settings SET value = ? WHERE key = 'password_hash'", (pw_hash,))
     conn.commit()
-    conn.close()
     return True
 
 
 # ── CRUD ──────────────────────────────────────────────────────────────────────
 
+# Monotonic counter bumped on every account mutation in this process —
+# cheap cache invalidation for derived artifacts (aliases file, list
+# responses) without re-querying the DB.
+_GENERATION = 0
+
+# PRAGMA data_version moves when a *different* connection commits, so a
+# single shared probe connection sees writes from other processes (CLI
+# mutating the DB while `serve` or `daemon` is up) that _GENERATION
+# alone would miss. One connection shared by all threads keeps the view
+# consistent; the pragma itself is a cheap in-memory read.
+_DV_CONN = None
+_DV_LOCK = threading.Lock()
+
+
+def _data_version() -> int:
+    global _DV_CONN
+    with _DV_LOCK:
+        if _DV_CONN is None:
+            DB_DIR.mkdir(parents=True, exist_ok=True)
+            _DV_CONN = sqlite3.connect(str(DB_PATH), check_same_thread=False)
+        return _DV_CONN.execute("PRAGMA data_version").fetchone()[0]
+
+
+def data_generation() -> int:
+    return _GENERATION + _data_version()
+
+
+def _bump_generation():
+    global _GENERATION
+    _GENERATION += 1
+
+
+def _now_ms() -> int:
+    # time_ns // 1000 stays in integers; time.time() goes through a float.
+    return time.time_ns() // 1_000_000
+
+
+_NAME_SANITIZE = re.compile(r"[^a-z0-9-]+")
+
+# Shared SQL literals: sqlite3 caches prepared statements keyed by the SQL
+# string, so identical literals at every call site reuse the same bytecode.
+_SQL_GET_BY_ID = "SELECT * FROM accounts WHERE id = ?"
+_SQL_GET_BY_NAME = "SELECT * FROM accounts WHERE name = ?"
+_SQL_LIST = "SELECT * FROM accounts ORDER BY created_at"
+
+
+def normalize_name(raw: str) -> str:
+    """Lowercase, trim, and collapse anything outside [a-z0-9-] to '-'.
+
+    Single compiled-regex pass shared by the CLI and the web API instead
+    of chained .lower().strip().replace() calls at each entry point.
+    """
+    return _NAME_SANITIZE.sub("-", raw.strip().lower()).strip("-")
+
+def _last6(value: str) -> str:
+    return value[-6:] if value else ""
+
+
 def add_account(account_id: str, name: str, auth_type: str,
                 api_key: str = "",
                 access_token: str = "", refresh_token: str = "",
                 expires_at: int = 0):
+    """Insert a new account. Raises ValueError if the name is taken.
+
+    Duplicate detection rides on the UNIQUE(name) constraint — no
+    SELECT-then-INSERT round-trip (which was also racy under the server).
+    """
     conn = get_db()
-    conn.execute(
-        """INSERT INTO accounts
-           (id, name, auth_type, api_key_enc, access_token_enc, refresh_token_enc, expires_at)
-           VALUES (?, ?, ?, ?, ?, ?, ?)""",
-        (
-            account_id, name, auth_type,
-            _encrypt(api_key),
-            _encrypt(access_token),
-            _encrypt(refresh_token),
-            expires_at,
+    key_enc, access_enc, refresh_enc = _encrypt_many(api_key, access_token, refresh_token)
+    try:
+        conn.execute(
+            """INSERT INTO accounts
+               (id, name, auth_type, api_key_enc, access_token_enc, refresh_token_enc, expires_at, key_last6)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
+            (
+                account_id, name, auth_type,
+                key_enc, access_enc, refresh_enc,
+                expires_at,
+                _last6(api_key if auth_type == "api_key" else access_token),
+            )
         )
-    )
+    except sqlite3.IntegrityError:
+        # The failed INSERT still opened a transaction — roll it back, or
+        # this thread's persistent connection keeps the write lock.
+        conn.rollback()
+        raise ValueError(f"Account name '{name}' already exists")
     conn.commit()
-    conn.close()
+    _bump_generation()
 
 
 def update_account(account_id: str, **kwargs):
     conn = get_db()
-    acc = conn.execute("SELECT * FROM accounts WHERE id = ?", (account_id,)).fetchone()
+    acc = conn.execute(_SQL_GET_BY_ID, (account_id,)).fetchone()
     if not acc:
-        conn.close()
         raise ValueError(f"Account {account_id} not found")
 
     fields = {
@@ -185,44 +423,48 @@ def update_account(account_id: str, **kwargs):
         "expires_at": kwargs.get("expires_at", acc["expires_at"]),
     }
 
+    if fields["auth_type"] == "api_key":
+        plain = kwargs.get("api_key")
+    else:
+        plain = kwargs.get("access_token")
+    fields["key_last6"] = _last6(plain) if plain is not None else acc["key_last6"]
+
     conn.execute(
         """UPDATE accounts SET name=?, auth_type=?, api_key_enc=?,
-           access_token_enc=?, refresh_token_enc=?, expires_at=?
+           access_token_enc=?, refresh_token_enc=?, expires_at=?, key_last6=?
            WHERE id=?""",
         (fields["name"], fields["auth_type"], fields["api_key_enc"],
          fields["access_token_enc"], fields["refresh_token_enc"],
-         fields["expires_at"], account_id)
+         fields["expires_at"], fields["key_last6"], account_id)
     )
     conn.commit()
-    conn.close()
+    _bump_generation()
 
 
 def delete_account(account_id: str):
     conn = get_db()
     conn.execute("DELETE FROM accounts WHERE id = ?", (account_id,))
     conn.commit()
-    conn.close()
+    _bump_generation()
 
 
 def get_account(account_id: str) -> dict | None:
     conn = get_db()
-    row = conn.execute("SELECT * FROM accounts WHERE id = ?", (account_id,)).fetchone()
-    conn.close()
+    row = conn.execute(_SQL_GET_BY_ID, (account_id,)).fetchone()
     return _row_to_safe_dict(row) if row else None
 
 
 def get_account_by_name(name: str) -> dict | None:
     conn = get_db()
-    row = conn.execute("SELECT * FROM accounts WHERE name = ?", (name,)).fetchone()
-    conn.close()
+    row = conn.execute(_SQL_GET_BY_NAME, (name,)).fetchone()
     return _row_to_safe_dict(row) if row else None
 
 
 def list_accounts() -> list[dict]:
     conn = get_db()
-    rows = conn.execute("SELECT * FROM accounts ORDER BY created_at").fetchall()
-    conn.close()
-    return [_row_to_safe_dict(r) for r in rows]
+    rows = conn.execute(_SQL_LIST).fetchall()
+    now_ms = _now_ms()
+    return [_row_to_safe_dict(r, now_ms) for r in rows]
 
 
 # ── Credential injection (the core!) ─────────────────────────────────────────
@@ -238,14 +480,35 @@ def get_launch_env(account_id: str) -> dict:
     Same shared .claude dir — just different env vars per session.
     """
     conn = get_db()
-    row = conn.execute("SELECT * FROM accounts WHERE id = ?", (account_id,)).fetchone()
-    if not row:
-        conn.close()
-        raise ValueError(f"Account {account_id} not found")
-
-    conn.execute("UPDATE accounts SET last_used = datetime('now') WHERE id = ?", (account_id,))
-    conn.commit()
-    conn.close()
+    # Single statement: bump last_used and read the row back in one pass
+    # (RETURNING needs SQLite >= 3.35, which ships with Python 3.10+).
+    # last_used is only rewritten once a minute — rapid successive launches
+    # coalesce into one WAL write instead of an fsync per invocation.
+    row = conn.execute(
+        """UPDATE accounts SET last_used = datetime('now')
+           WHERE id = ?
+             AND (last_used IS NULL OR last_used < datetime('now', '-60 seconds'))
+           RETURNING name, auth_type, api_key_enc, access_token_enc,
+                     refresh_token_enc, expires_at""",
+        (account_id,)
+    ).fetchone()
+    if row:
+        conn.commit()
+        _bump_generation()  # last_used changed — listings must re-render
+    else:
+        # Either unknown id or last_used is fresh. The UPDATE still opened
+        # a write transaction even though it matched nothing — close it, or
+        # this connection keeps the WAL write lock (and a stale snapshot)
+        # until some later commit.
+        conn.rollback()
+        row = conn.execute(
+            """SELECT name, auth_type, api_key_enc, access_token_enc,
+                      refresh_token_enc, expires_at
+               FROM accounts WHERE id = ?""",
+            (account_id,)
+        ).fetchone()
+        if not row:
+            raise ValueError(f"Account {account_id} not found")
 
     if row["auth_type"] == "api_key":
         api_key = _decrypt(row["api_key_enc"])
@@ -259,18 +522,12 @@ def get_launch_env(account_id: str) -> dict:
             raise ValueError(f"No OAuth token for account {account_id}. Run: claude-accounts login {row['name']}")
 
         if row["expires_at"] > 0:
-            now_ms = int(time.time() * 1000)
+            now_ms = _now_ms()
             if now_ms > row["expires_at"]:
                 # Auto-refresh if refresh token is available
                 if row["refresh_token_enc"]:
                     try:
-                        result = refresh_oauth_token(account_id)
-                        access_token = _decrypt(
-                            get_db().execute(
-                                "SELECT access_token_enc FROM accounts WHERE id = ?",
-                                (account_id,)
-                            ).fetchone()["access_token_enc"]
-                        )
+                        access_token = refresh_oauth_token(account_id)["access_token"]
                     except Exception as e:
                         raise ValueError(
                             f"OAuth token expired and refresh failed for '{row['name']}': {e}. "
@@ -285,10 +542,75 @@ def get_launch_env(account_id: str) -> dict:
         return {"CLAUDE_CODE_OAUTH_TOKEN": access_token}
 
 
-def get_token_status(account_id: str) -> dict:
+def list_accounts_with_secrets() -> list[dict]:
+    """
+    Fetch all accounts with decrypted credentials in one query + one cipher
+    pass. For read-only bulk consumers (alias generation): unlike calling
+    get_launch_env per account, this never writes last_used.
+    """
     conn = get_db()
-    row = conn.execute("SELECT * FROM accounts WHERE id = ?", (account_id,)).fetchone()
-    conn.close()
+    rows = conn.execute(
+        """SELECT id, name, auth_type, api_key_enc, access_token_enc,
+                  refresh_token_enc, expires_at
+           FROM accounts ORDER BY created_at"""
+    ).fetchall()
+
+    return [{
+        "id": row["id"],
+        "name": row["name"],
+        "auth_type": row["auth_type"],
+        "api_key": _decrypt(row["api_key_enc"]),
+        "access_token": _decrypt(row["access_token_enc"]),
+        "has_refresh": bool(row["refresh_token_enc"]),
+        "expires_at": row["expires_at"],
+    } for row in rows]
+
+
+def get_launch_env_readonly(acc: dict) -> dict:
+    """
+    Build launch env vars from an already-decrypted account dict (from
+    list_accounts_with_secrets). No SELECT, no last_used bump, no refresh
+    attempt — suited to generating N aliases without N transactions.
+    """
+    if acc["auth_type"] == "api_key":
+        if not acc["api_key"]:
+            raise ValueError(f"No API key stored for account {acc['id']}")
+        return {"ANTHROPIC_API_KEY": acc["api_key"]}
+
+    if not acc["access_token"]:
+        raise ValueError(f"No OAuth token for account {acc['id']}. Run: claude-accounts login {acc['name']}")
+    if acc["expires_at"] > 0 and _now_ms() > acc["expires_at"]:
+        raise ValueError(
+            f"OAuth token expired for '{acc['name']}'. "
+            f"Run: claude-accounts refresh {acc['name']}"
+        )
+    return {"CLAUDE_CODE_OAUTH_TOKEN": acc["access_token"]}
+
+
+# The UI polls token status continuously, but the underlying columns only
+# change on mutations — read through a generation-keyed row cache so the
+# hot path is a dict hit, not a SQLite query.
+_STATUS_ROWS = {"gen": -1, "rows": {}}
+
+
+def _get_status_row(account_id: str):
+    gen = data_generation()
+    if _STATUS_ROWS["gen"] != gen:
+        _STATUS_ROWS["rows"] = {}
+        _STATUS_ROWS["gen"] = gen
+    rows = _STATUS_ROWS["rows"]
+    if account_id not in rows:
+        rows[account_id] = get_db().execute(
+            """SELECT auth_type, api_key_enc, access_token_enc,
+                      refresh_token_enc, expires_at
+               FROM accounts WHERE id = ?""",
+            (account_id,)
+        ).fetchone()
+    return rows[account_id]
+
+
+def get_token_status(account_id: str) -> dict:
+    row = _get_status_row(account_id)
     if not row:
         return {"status": "not_found"}
 
@@ -297,14 +619,14 @@ def get_token_status(account_id: str) -> dict:
 
     has_token = bool(row["access_token_enc"])
     expires_at = row["expires_at"]
-    now_ms = int(time.time() * 1000)
+    now_ms = _now_ms()
 
     if not has_token:
         return {"status": "needs_login", "type": "oauth"}
     if expires_at > 0 and now_ms > expires_at:
         return {"status": "expired", "type": "oauth", "has_refresh": bool(row["refresh_token_enc"])}
 
-    remaining = int((expires_at - now_ms) / 60000) if expires_at > 0 else None
+    remaining = (expires_at - now_ms) // 60000 if expires_at > 0 else None
     return {"status": "ok", "type": "oauth", "remaining_min": remaining, "has_refresh": bool(row["refresh_token_enc"])}
 
 
@@ -334,8 +656,7 @@ def capture_oauth_tokens(account_id: str, credentials_path: str = None) -> dict:
             f"Run 'claude' first to authenticate, then capture the tokens."
         )
 
-    with open(path) as f:
-        data = json.load(f)
+    data = _json_loads(path.read_bytes())
 
     oauth = data.get("claudeAiOauth", {})
     access_token = oauth.get("accessToken", "")
@@ -354,7 +675,7 @@ def capture_oauth_tokens(account_id: str, credentials_path: str = None) -> dict:
 
     remaining = None
     if expires_at > 0:
-        remaining = int((expires_at - time.time() * 1000) / 60000)
+        remaining = (expires_at - _now_ms()) // 60000
 
     return {
         "captured": True,
@@ -369,15 +690,49 @@ def capture_oauth_tokens(account_id: str, credentials_path: str = None) -> dict:
 OAUTH_TOKEN_URL = "https://platform.claude.com/v1/oauth/token"
 OAUTH_CLIENT_ID = "9d1c250a-e61b-44d9-88ed-5944d1962f5e"
 
+_HTTP = None
+
+
+def _get_http():
+    # Shared Session with keep-alive: refreshing several accounts reuses
+    # the TLS connection instead of paying a handshake per call.
+    global _HTTP
+    if _HTTP is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+        session = requests.Session()
+        session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+        _HTTP = session
+    return _HTTP
+
+
+# One lock per account: refresh tokens are single-use, so two concurrent
+# refreshes of the same account would burn the token and kill the session.
+# Different accounts refresh in parallel (requests releases the GIL on I/O).
+_REFRESH_LOCKS = {}
+_REFRESH_LOCKS_LOCK = threading.Lock()
+
+
+def _refresh_lock(account_id: str) -> threading.Lock:
+    with _REFRESH_LOCKS_LOCK:
+        lock = _REFRESH_LOCKS.get(account_id)
+        if lock is None:
+            lock = _REFRESH_LOCKS[account_id] = threading.Lock()
+        return lock
+
 
 def refresh_oauth_token(account_id: str) -> dict:
     """
     Refresh an expired OAuth token using the stored refresh token.
     The refresh token is single-use: a new one is returned each time.
     """
+    with _refresh_lock(account_id):
+        return _refresh_oauth_token_locked(account_id)
+
+
+def _refresh_oauth_token_locked(account_id: str) -> dict:
     conn = get_db()
-    row = conn.execute("SELECT * FROM accounts WHERE id = ?", (account_id,)).fetchone()
-    conn.close()
+    row = conn.execute(_SQL_GET_BY_ID, (account_id,)).fetchone()
 
     if not row:
         raise ValueError(f"Account {account_id} not found")
@@ -391,8 +746,10 @@ def refresh_oauth_token(account_id: str) -> dict:
             f"Run: claude-accounts login {row['name']}"
         )
 
+    import requests
+
     try:
-        resp = requests.post(OAUTH_TOKEN_URL, json={
+        resp = _get_http().post(OAUTH_TOKEN_URL, json={
             "grant_type": "refresh_token",
             "refresh_token": refresh_token,
             "client_id": OAUTH_CLIENT_ID,
@@ -415,7 +772,7 @@ def refresh_oauth_token(account_id: str) -> dict:
     if not new_access:
         raise ValueError("OAuth refresh response missing access_token")
 
-    expires_at = int(time.time() * 1000) + (expires_in * 1000) if expires_in else 0
+    expires_at = _now_ms() + expires_in * 1000 if expires_in else 0
 
     update_account(
         account_id,
@@ -424,39 +781,35 @@ def refresh_oauth_token(account_id: str) -> dict:
         expires_at=expires_at,
     )
 
-    _sync_credentials_file(account_id)
+    _sync_credentials_file(new_access, new_refresh, expires_at)
 
     remaining_min = int(expires_in / 60) if expires_in else None
     return {
         "refreshed": True,
+        # Plaintext token so get_launch_env doesn't re-read and re-decrypt
+        # the row it just wrote. API handlers must strip this before
+        # returning the dict to clients.
+        "access_token": new_access,
         "token_preview": f"sk-ant-oat01-...{new_access[-6:]}",
         "expires_in_min": remaining_min,
     }
 
 
-def _sync_credentials_file(account_id: str):
+def _sync_credentials_file(access_token: str, refresh_token: str, expires_at: int):
     """
     Sync refreshed tokens back to ~/.claude/.credentials.json
     so Claude Code can use them directly.
-    Writes atomically via temp file + rename.
-    """
-    conn = get_db()
-    row = conn.execute("SELECT * FROM accounts WHERE id = ?", (account_id,)).fetchone()
-    conn.close()
-    if not row or row["auth_type"] != "oauth":
-        return
-
-    access_token = _decrypt(row["access_token_enc"])
-    refresh_token = _decrypt(row["refresh_token_enc"])
-    expires_at = row["expires_at"]
 
+    Takes the plaintext tokens the caller already has in scope — no extra
+    SELECT + decrypt of the row that was just written. Other keys in the
+    file are preserved; writes atomically via temp file + rename.
+    """
     cred_path = CREDENTIALS_PATH
     data = {}
     if cred_path.exists():
         try:
-            with open(cred_path) as f:
-                data = json.load(f)
-        except (json.JSONDecodeError, OSError):
+            data = _json_loads(cred_path.read_bytes())
+        except (ValueError, OSError):
             data = {}
 
     data["claudeAiOauth"] = {
@@ -469,58 +822,86 @@ def _sync_credentials_file(account_id: str):
     cred_dir.mkdir(parents=True, exist_ok=True)
     fd, tmp_path = tempfile.mkstemp(dir=str(cred_dir), suffix=".tmp")
     try:
-        with os.fdopen(fd, "w") as f:
-            json.dump(data, f, indent=2)
+        try:
+            os.write(fd, _json_dump_bytes(data))
+        finally:
+            os.close(fd)
         os.replace(tmp_path, str(cred_path))
         os.chmod(str(cred_path), 0o600)
     except Exception:
-        if os.path.exists(tmp_path):
+        try:
             os.unlink(tmp_path)
+        except FileNotFoundError:
+            pass
         raise
 
 
 # ── Export / Import ───────────────────────────────────────────────────────────
 
-def export_all() -> list[dict]:
+def _export_entry(row) -> dict:
+    entry = {"name": row["name"], "auth_type": row["auth_type"]}
+    if row["auth_type"] == "api_key":
+        entry["api_key"] = _decrypt(row["api_key_enc"])
+    else:
+        entry["access_token"] = _decrypt(row["access_token_enc"])
+        entry["refresh_token"] = _decrypt(row["refresh_token_enc"])
+        entry["expires_at"] = row["expires_at"]
+    return entry
+
+
+def iter_export():
+    """Yield export entries row by row with a shared cipher (no full list)."""
     conn = get_db()
-    rows = conn.execute("SELECT * FROM accounts ORDER BY created_at").fetchall()
-    conn.close()
-    result = []
-    for row in rows:
-        entry = {"name": row["name"], "auth_type": row["auth_type"]}
-        if row["auth_type"] == "api_key":
-            entry["api_key"] = _decrypt(row["api_key_enc"])
-        else:
-            entry["access_token"] = _decrypt(row["access_token_enc"])
-            entry["refresh_token"] = _decrypt(row["refresh_token_enc"])
-            entry["expires_at"] = row["expires_at"]
-        result.append(entry)
-    return result
+    for row in conn.execute(_SQL_LIST):
+        yield _export_entry(row)
 
 
 def import_accounts(data: list[dict]) -> int:
-    count = 0
+    # One transaction for the whole import: INSERT OR IGNORE leans on the
+    # UNIQUE(name) constraint instead of a SELECT per entry, and
+    # executemany batches K inserts into a single commit/fsync.
+    rows = []
     for entry in data:
         name = entry.get("name", "").strip()
-        if not name or get_account_by_name(name):
+        if not name:
             continue
-        account_id = f"acc_{name}_{os.urandom(4).hex()}"
-        add_account(
-            account_id=account_id,
-            name=name,
-            auth_type=entry.get("auth_type", "api_key"),
-            api_key=entry.get("api_key", ""),
-            access_token=entry.get("access_token", ""),
-            refresh_token=entry.get("refresh_token", ""),
-            expires_at=entry.get("expires_at", 0),
+        auth_type = entry.get("auth_type", "api_key")
+        key_enc, access_enc, refresh_enc = _encrypt_many(
+            entry.get("api_key", ""),
+            entry.get("access_token", ""),
+            entry.get("refresh_token", ""),
         )
-        count += 1
-    return count
+        rows.append((
+            f"acc_{name}_{os.urandom(4).hex()}",
+            name,
+            auth_type,
+            key_enc, access_enc, refresh_enc,
+            entry.get("expires_at", 0),
+            _last6(entry.get("api_key", "") if auth_type == "api_key" else entry.get("access_token", "")),
+        ))
+
+    if not rows:
+        return 0
+
+    conn = get_db()
+    with conn:
+        cur = conn.executemany(
+            """INSERT OR IGNORE INTO accounts
+               (id, name, auth_type, api_key_enc, access_token_enc, refresh_token_enc, expires_at, key_last6)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
+            rows,
+        )
+    _bump_generation()
+    return cur.rowcount
 
 
 # ── Helpers ───────────────────────────────────────────────────────────────────
 
-def _row_to_safe_dict(row) -> dict:
+def _row_to_safe_dict(row, now_ms=None) -> dict:
+    # Callers iterating many rows pass the timestamp once; single-row
+    # callers let us compute it here.
+    if now_ms is None:
+        now_ms = _now_ms()
     d = {
         "id": row["id"],
         "name": row["name"],
@@ -530,18 +911,23 @@ def _row_to_safe_dict(row) -> dict:
         "expires_at": row["expires_at"],
     }
 
-    if row["auth_type"] == "api_key":
-        d["masked_key"] = _mask(row["api_key_enc"], "sk-ant-...{}")
+    # Prefer the plaintext last-6 column (no decrypt); fall back to
+    # decrypting for rows created before the key_last6 migration.
+    template = "sk-ant-...{}" if row["auth_type"] == "api_key" else "oat01-...{}"
+    cred_enc = row["api_key_enc"] if row["auth_type"] == "api_key" else row["access_token_enc"]
+    if row["key_last6"]:
+        d["masked_key"] = template.format(row["key_last6"])
     else:
-        d["masked_key"] = _mask(row["access_token_enc"], "oat01-...{}")
+        d["masked_key"] = _mask(cred_enc, template)
+
+    if row["auth_type"] != "api_key":
         d["has_refresh"] = bool(row["refresh_token_enc"])
         if row["expires_at"] > 0:
-            now_ms = int(time.time() * 1000)
             if now_ms > row["expires_at"]:
                 d["token_status"] = "expired"
             else:
                 d["token_status"] = "valid"
-                d["expires_in_min"] = int((row["expires_at"] - now_ms) / 60000)
+                d["expires_in_min"] = (row["expires_at"] - now_ms) // 60000
         else:
             d["token_status"] = "no_expiry"
 
@@ -5,19 +5,24 @@ Single shared .claude dir.
 """
 
 import os
+import json
 import uuid
 import shlex
 import pty
 import select
+import selectors
 import signal
 import struct
 import fcntl
 import termios
 import threading
+import functools
 import glob
 import time
 import secrets
 import webbrowser
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta
 from pathlib import Path
 from flask import Flask, request, jsonify, send_from_directory, Response, session
@@ -25,51 +30,147 @@ from flask_socketio import SocketIO, emit, disconnect
 
 import db
 
+# Initialize the schema at import time so WSGI deployments (where
+# start_server never runs) don't hit missing-table errors on first request.
+db.init_db()
+
+HOME = Path.home()
+HOME_STR = str(HOME)
+CREDENTIALS_PATH = HOME / ".claude" / ".credentials.json"
+
 
 # ── Flask secret key (persistent) ────────────────────────────────────────────
 
 def _get_or_create_secret_key() -> str:
+    # DB_DIR already exists: db.init_db() above created it. O_CREAT|O_EXCL
+    # makes first-start creation atomic — two racing processes can't both
+    # write a key, and 0o600 applies from the moment the file exists
+    # instead of via a chmod after the write.
     secret_path = db.DB_DIR / ".flask_secret"
-    if secret_path.exists():
+    try:
+        fd = os.open(str(secret_path), os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o600)
+    except FileExistsError:
         return secret_path.read_text().strip()
     key = secrets.token_hex(32)
-    db.DB_DIR.mkdir(parents=True, exist_ok=True)
-    secret_path.write_text(key)
-    os.chmod(str(secret_path), 0o600)
+    try:
+        os.write(fd, key.encode())
+    finally:
+        os.close(fd)
     return key
 
 
 app = Flask(__name__, static_folder="static")
+
+# When orjson is installed, route every jsonify/request.json through it —
+# C-level encode straight to UTF-8 bytes instead of the stdlib encoder.
+# Optional, like in db.py: without it Flask keeps its default provider.
+try:
+    import orjson as _orjson
+    from flask.json.provider import JSONProvider
+
+    class _OrjsonProvider(JSONProvider):
+        def dumps(self, obj, **kwargs):
+            # str, not bytes: the session cookie serializer signs the
+            # output and expects text.
+            return _orjson.dumps(obj).decode()
+
+        def loads(self, s, **kwargs):
+            return _orjson.loads(s)
+
+    app.json = _OrjsonProvider(app)
+
+    # The session cookie only ever holds flat JSON types (the
+    # authenticated flag), so itsdangerous' TaggedJSONSerializer — whose
+    # tag/untag dispatch exists for datetimes, bytes and the like — can
+    # be swapped for plain orjson. The HMAC signing layer is untouched.
+    from flask.sessions import SecureCookieSessionInterface
+
+    class _OrjsonSessionSerializer:
+        @staticmethod
+        def dumps(value):
+            # str so itsdangerous treats this as a text serializer and
+            # returns a str cookie value.
+            return _orjson.dumps(value).decode()
+
+        @staticmethod
+        def loads(value):
+            return _orjson.loads(value)
+
+    class _FastSessionInterface(SecureCookieSessionInterface):
+        serializer = _OrjsonSessionSerializer()
+
+    app.session_interface = _FastSessionInterface()
+except ImportError:
+    pass
+
 app.secret_key = _get_or_create_secret_key()
 app.permanent_session_lifetime = timedelta(days=7)
 socketio = SocketIO(app, cors_allowed_origins="*", async_mode="threading")
 
-# Active terminal sessions: {sid: {fd, pid}}
+# Credentials watchers reuse pooled threads instead of paying a clone()
+# plus stack allocation for every login attempt. PTY output needs no pool:
+# the selector dispatcher is a single long-lived thread. Each watcher gives
+# up after _WATCH_DEADLINE seconds, so abandoned login terminals release
+# their slot instead of starving later logins out of the pool.
+_watch_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="login-watch")
+_WATCH_DEADLINE = 600.0  # seconds — well past any real OAuth flow
+
+# Active terminal sessions: {sid: {fd, pid}}. The lock covers compound
+# register/cleanup sequences (pop + close + kill) that could otherwise
+# interleave between a disconnect handler and the dispatcher; the
+# per-keystroke path stays a single GIL-atomic dict read.
 _terminals = {}
+_terminals_lock = threading.Lock()
+# Flat sid -> fd map so the per-keystroke input path is one dict lookup
+_fd_by_sid = {}
 
-# Rate limiting for login: {ip: [timestamps]}
+# Rate limiting for login: {ip: deque of failure timestamps}. The deque's
+# maxlen bounds memory per IP; the window check only looks at the oldest
+# entry, and the lock closes the read-modify-write race between workers.
 _login_attempts = {}
+_login_lock = threading.Lock()
 _LOGIN_MAX = 10
 _LOGIN_WINDOW = 900  # 15 minutes
 
 
 # ── Auth middleware ───────────────────────────────────────────────────────────
 
-_PUBLIC_PATHS = {"/api/auth/status", "/api/auth/login", "/api/auth/setup"}
+_PUBLIC_PATHS = frozenset({"/api/auth/status", "/api/auth/login", "/api/auth/setup"})
+
+# Verified API tokens, token -> monotonic expiry. Clients send the same
+# header on every request; a short TTL skips the settings SELECT + hash
+# on the hot path while keeping a rotated token honored within a minute.
+_token_cache = {}
+_token_cache_lock = threading.Lock()
+_TOKEN_CACHE_TTL = 60.0
+
+
+def _check_api_token(token: str) -> bool:
+    now = time.monotonic()
+    exp = _token_cache.get(token)
+    if exp is not None and exp > now:
+        return True
+    if not db.verify_api_token(token):
+        return False
+    with _token_cache_lock:
+        if len(_token_cache) > 16:  # only ever holds the one real token
+            _token_cache.clear()
+        _token_cache[token] = now + _TOKEN_CACHE_TTL
+    return True
 
 
 @app.before_request
 def auth_guard():
-    # Static files and public auth endpoints
+    # Static files (everything outside /api/, including /) and public
+    # auth endpoints — one prefix test kills the whole static tree.
     path = request.path
-    if path == "/" or not path.startswith("/api/"):
-        return None
-    if path in _PUBLIC_PATHS:
+    if not path.startswith("/api/") or path in _PUBLIC_PATHS:
         return None
 
-    # Check API token header
-    token = request.headers.get("X-Auth-Token", "")
-    if token and db.verify_api_token(token):
+    # Check API token header — straight from the WSGI environ, skipping
+    # Werkzeug's case-insensitive header walk on every request.
+    token = request.environ.get("HTTP_X_AUTH_TOKEN")
+    if token and _check_api_token(token):
         return None
 
     # Check session cookie
@@ -108,21 +209,23 @@ def api_auth_setup():
 def api_auth_login():
     ip = request.remote_addr or "unknown"
     now = time.time()
-    # Rate limit
-    attempts = _login_attempts.get(ip, [])
-    attempts = [t for t in attempts if now - t < _LOGIN_WINDOW]
-    if len(attempts) >= _LOGIN_MAX:
-        return jsonify({"error": "Too many attempts. Try again later."}), 429
+    # Rate limit: full deque with its oldest failure still in the window
+    # means the cap is hit — O(1) instead of rescanning the whole list.
+    with _login_lock:
+        attempts = _login_attempts.setdefault(ip, deque(maxlen=_LOGIN_MAX))
+        if len(attempts) == _LOGIN_MAX and now - attempts[0] < _LOGIN_WINDOW:
+            return jsonify({"error": "Too many attempts. Try again later."}), 429
 
     d = request.json or {}
     password = d.get("password", "")
     if not db.verify_password(password):
-        attempts.append(now)
-        _login_attempts[ip] = attempts
+        with _login_lock:
+            attempts.append(now)
         return jsonify({"error": "Invalid password"}), 401
 
     # Clear attempts on success
-    _login_attempts.pop(ip, None)
+    with _login_lock:
+        _login_attempts.pop(ip, None)
     session.permanent = True
     session["authenticated"] = True
     return jsonify({"status": "ok"})
@@ -146,38 +249,63 @@ def api_auth_change_password():
     return jsonify({"status": "password_changed"})
 
 
+# Per-process salt for every ETag: generations restart at their base on
+# process start, so without it a tag from the previous run could 304
+# against different data after a restart.
+_ETAG_SEED = secrets.token_hex(4)
+
+# Account list cache, keyed by data generation plus the current minute
+# (expires_in_min counts down per minute and must stay fresh).
+_accounts_cache = {"key": None, "data": None}
+
+
 @app.route("/api/accounts", methods=["GET"])
 def api_list():
-    return jsonify(db.list_accounts())
+    # ETag covers the same key as the cache — generation and minute —
+    # so a conditional poller still sees token status flip when only
+    # time has moved. Matches get a bodyless 304 instead of a
+    # re-serialized list.
+    key = (db.data_generation(), int(time.time() // 60))
+    etag = f'"accounts-{_ETAG_SEED}-{key[0]}-{key[1]}"'
+    if request.headers.get("If-None-Match") == etag:
+        return Response(status=304, headers={"ETag": etag})
+
+    if _accounts_cache["key"] != key:
+        _accounts_cache["data"] = db.list_accounts()
+        _accounts_cache["key"] = key
+    resp = jsonify(_accounts_cache["data"])
+    resp.headers["ETag"] = etag
+    return resp
 
 
 @app.route("/api/accounts", methods=["POST"])
 def api_add():
     d = request.json or {}
-    name = d.get("name", "").strip().lower().replace(" ", "-")
+    name = db.normalize_name(d.get("name", ""))
     auth_type = d.get("auth_type", "api_key")
 
     if not name or len(name) < 2:
         return jsonify({"error": "Nom invalide (min 2 car.)"}), 400
-    if db.get_account_by_name(name):
-        return jsonify({"error": f"'{name}' existe déjà"}), 409
 
     aid = f"acc_{uuid.uuid4().hex[:8]}"
 
-    if auth_type == "api_key":
-        api_key = d.get("api_key", "")
-        if not api_key:
-            return jsonify({"error": "Clé API requise"}), 400
-        db.add_account(aid, name, "api_key", api_key=api_key)
-    else:
-        # OAuth: create account, tokens captured later
-        access_token = d.get("access_token", "")
-        refresh_token = d.get("refresh_token", "")
-        expires_at = d.get("expires_at", 0)
-        db.add_account(aid, name, "oauth",
-                       access_token=access_token,
-                       refresh_token=refresh_token,
-                       expires_at=expires_at)
+    try:
+        if auth_type == "api_key":
+            api_key = d.get("api_key", "")
+            if not api_key:
+                return jsonify({"error": "Clé API requise"}), 400
+            db.add_account(aid, name, "api_key", api_key=api_key)
+        else:
+            # OAuth: create account, tokens captured later
+            access_token = d.get("access_token", "")
+            refresh_token = d.get("refresh_token", "")
+            expires_at = d.get("expires_at", 0)
+            db.add_account(aid, name, "oauth",
+                           access_token=access_token,
+                           refresh_token=refresh_token,
+                           expires_at=expires_at)
+    except ValueError:
+        return jsonify({"error": f"'{name}' existe déjà"}), 409
 
     return jsonify({"id": aid, "name": name}), 201
 
@@ -233,6 +361,7 @@ def api_refresh_oauth(aid):
     """
     try:
         result = db.refresh_oauth_token(aid)
+        result.pop("access_token", None)  # plaintext stays server-side
         return jsonify(result)
     except ValueError as e:
         return jsonify({"error": str(e)}), 400
@@ -251,101 +380,174 @@ def api_launch(aid):
         return jsonify({"error": str(e)}), 400
 
     acc = db.get_account(aid)
-    parts = [f'{k}={shlex.quote(v)}' for k, v in env_vars.items()]
-    parts.append("claude")
+    command = _launch_command(env_vars)
 
     return jsonify({
-        "command": " ".join(parts),
-        "alias": f"alias claude-{acc['name']}='{' '.join(parts)}'",
+        "command": command,
+        "alias": f"alias claude-{acc['name']}='{command}'",
         "env_keys": list(env_vars.keys()),
         "account": acc["name"],
     })
 
 
-def _cli_paths():
-    """Return (python_path, cli_path) using venv if available."""
-    project_dir = Path(__file__).resolve().parent
-    venv_python = project_dir / "venv" / "bin" / "python"
-    cli_path = project_dir / "cli.py"
-    py = str(venv_python) if venv_python.exists() else "python3"
-    return py, str(cli_path)
+# shlex.quote runs a regex scan per call; tokens repeat across alias
+# renders, so a small LRU answers nearly every call after the first pass.
+_quote = functools.lru_cache(maxsize=1024)(shlex.quote)
 
 
-@app.route("/api/generate-aliases", methods=["GET"])
-def api_aliases():
-    accounts = db.list_accounts()
-    py, cli_path = _cli_paths()
+def _launch_command(env_vars: dict) -> str:
+    # Quote each env value exactly once and join exactly once — the result
+    # is reused for both the command and the alias line.
+    return " ".join(f"{k}={_quote(v)}" for k, v in env_vars.items()) + " claude"
+
+
+_CLI_PATHS = None
+
+
+def _cli_paths():
+    """Return (python_path, cli_path) using venv if available.
+
+    Resolved once per process — the readlink chain and exists() probe
+    never change while the server runs.
+    """
+    global _CLI_PATHS
+    if _CLI_PATHS is None:
+        project_dir = Path(__file__).resolve().parent
+        venv_python = project_dir / "venv" / "bin" / "python"
+        cli_path = project_dir / "cli.py"
+        py = str(venv_python) if venv_python.exists() else "python3"
+        _CLI_PATHS = (py, str(cli_path))
+    return _CLI_PATHS
+
+
+# Script headers depend only on the process-constant CLI paths — rendered
+# once on first use instead of line-by-line per request.
+_SCRIPT_HEADERS = {}
+
+
+def _script_header(title: str) -> str:
+    header = _SCRIPT_HEADERS.get(title)
+    if header is None:
+        py, cli_path = _cli_paths()
+        header = _SCRIPT_HEADERS[title] = (
+            "#!/usr/bin/env bash\n"
+            f"{title}\n"
+            "\n"
+            "# CLI wrapper (auto-activates venv)\n"
+            "claude-accounts() {\n"
+            f'    "{py}" "{cli_path}" "$@"\n'
+            "}\n"
+        )
+    return header
+
+
+def _render_aliases_script() -> str:
+    # One SELECT + one decrypt pass for all accounts; no last_used writes.
+    accounts = db.list_accounts_with_secrets()
     lines = [
-        "#!/usr/bin/env bash",
-        "# Claude Accounts Manager — auto-generated aliases",
-        "# All accounts share one .claude dir, credentials injected via env vars",
-        "",
-        "# CLI wrapper (auto-activates venv)",
-        "claude-accounts() {",
-        f'    "{py}" "{cli_path}" "$@"',
-        "}",
-        "",
+        _script_header(
+            "# Claude Accounts Manager — auto-generated aliases\n"
+            "# All accounts share one .claude dir, credentials injected via env vars"
+        ),
     ]
     for acc in accounts:
         try:
-            env_vars = db.get_launch_env(acc["id"])
-            parts = [f'{k}={shlex.quote(v)}' for k, v in env_vars.items()]
-            parts.append("claude")
+            env_vars = db.get_launch_env_readonly(acc)
             lines.append(f"# {acc['name']} ({acc['auth_type']})")
-            lines.append(f"alias claude-{acc['name']}='{' '.join(parts)}'")
+            lines.append(f"alias claude-{acc['name']}='{_launch_command(env_vars)}'")
             lines.append("")
         except Exception as e:
             lines.append(f"# {acc['name']} — ERROR: {e}")
             lines.append("")
 
-    return Response("\n".join(lines), mimetype="text/plain")
+    return "\n".join(lines)
+
+
+# Rendered aliases script, invalidated by db.data_generation()
+_aliases_cache = {"gen": -1, "text": ""}
+
+
+@app.route("/api/generate-aliases", methods=["GET"])
+def api_aliases():
+    gen = db.data_generation()
+    etag = f'"aliases-{_ETAG_SEED}-{gen}"'
+    if request.headers.get("If-None-Match") == etag:
+        return Response(status=304, headers={"ETag": etag})
+
+    if _aliases_cache["gen"] != gen:
+        _aliases_cache["text"] = _render_aliases_script()
+        _aliases_cache["gen"] = gen
+
+    return Response(_aliases_cache["text"], mimetype="text/plain",
+                    headers={"ETag": etag})
+
+
+# Generation of the last aliases.sh written — repeat installs with no
+# account changes skip the rebuild and rewrite entirely.
+_install_state = {"gen": -1, "count": 0}
 
 
 @app.route("/api/install-aliases", methods=["POST"])
 def api_install():
-    accounts = db.list_accounts()
-    aliases_dir = Path.home() / ".claude-accounts"
-    aliases_dir.mkdir(parents=True, exist_ok=True)
+    aliases_dir = HOME / ".claude-accounts"
     aliases_file = aliases_dir / "aliases.sh"
 
-    py, cli_path = _cli_paths()
-    lines = [
-        "#!/usr/bin/env bash",
-        "# Claude Accounts Manager",
-        "",
-        "# CLI wrapper (auto-activates venv)",
-        "claude-accounts() {",
-        f'    "{py}" "{cli_path}" "$@"',
-        "}",
-        "",
-    ]
-    for acc in accounts:
-        try:
-            env_vars = db.get_launch_env(acc["id"])
-            parts = [f'{k}={shlex.quote(v)}' for k, v in env_vars.items()]
-            parts.append("claude")
-            lines.append(f"alias claude-{acc['name']}='{' '.join(parts)}'")
-        except Exception:
-            pass
+    gen = db.data_generation()
+    if _install_state["gen"] != gen or not aliases_file.exists():
+        accounts = db.list_accounts_with_secrets()
+        aliases_dir.mkdir(parents=True, exist_ok=True)
+
+        lines = [_script_header("# Claude Accounts Manager")]
+        for acc in accounts:
+            try:
+                env_vars = db.get_launch_env_readonly(acc)
+                lines.append(f"alias claude-{acc['name']}='{_launch_command(env_vars)}'")
+            except Exception:
+                pass
 
-    aliases_file.write_text("\n".join(lines) + "\n")
-    os.chmod(str(aliases_file), 0o600)
+        aliases_file.write_text("\n".join(lines) + "\n")
+        os.chmod(str(aliases_file), 0o600)
+        _install_state["gen"] = gen
+        _install_state["count"] = len(accounts)
 
     source_line = f'source "{aliases_file}"'
+    needle = source_line.encode()
     added_to = []
     for rc in [".bashrc", ".zshrc"]:
-        rc_path = Path.home() / rc
-        if rc_path.exists() and source_line not in rc_path.read_text():
+        rc_path = HOME / rc
+        try:
+            # Byte-level membership test: no UTF-8 decode of the whole rc
+            # file just to find one line (str.__contains__ on bytes is a
+            # C memmem, same as mmap.find, without the empty-file caveat).
+            present = needle in rc_path.read_bytes()
+        except FileNotFoundError:
+            continue
+        if not present:
             with open(rc_path, "a") as f:
                 f.write(f"\n# Claude Accounts Manager\n{source_line}\n")
             added_to.append(rc)
 
-    return jsonify({"aliases_file": str(aliases_file), "added_to": added_to, "count": len(accounts)})
+    return jsonify({"aliases_file": str(aliases_file), "added_to": added_to,
+                    "count": _install_state["count"]})
 
 
 @app.route("/api/export", methods=["GET"])
 def api_export():
-    return jsonify(db.export_all())
+    etag = f'"export-{_ETAG_SEED}-{db.data_generation()}"'
+    if request.headers.get("If-None-Match") == etag:
+        return Response(status=304, headers={"ETag": etag})
+
+    # Stream one decrypted entry at a time instead of materializing the
+    # whole list before the first byte; peak memory is a single row.
+    def generate():
+        yield "["
+        first = True
+        for entry in db.iter_export():
+            yield ("" if first else ",") + json.dumps(entry, separators=(",", ":"))
+            first = False
+        yield "]"
+    return Response(generate(), mimetype="application/json",
+                    headers={"ETag": etag})
 
 
 @app.route("/api/import", methods=["POST"])
@@ -363,34 +565,45 @@ def api_import():
 def api_browse():
     """List directories for the directory picker. ?path= to browse."""
     raw = request.args.get("path", "")
-    base = os.path.expanduser(raw) if raw else str(Path.home())
+    base = os.path.expanduser(raw) if raw else HOME_STR
     base = os.path.abspath(base)
 
     if not os.path.isdir(base):
         return jsonify({"error": f"Not a directory: {base}"}), 400
 
-    dirs = []
+    # Filter before sorting: only directories matter, so files (usually
+    # the bulk of a large directory) never get a sort key computed.
     try:
-        for entry in sorted(os.scandir(base), key=lambda e: e.name.lower()):
-            if entry.name.startswith("."):
-                continue
-            if entry.is_dir(follow_symlinks=False):
-                has_children = False
-                try:
+        with os.scandir(base) as it:
+            children = [
+                entry for entry in it
+                if not entry.name.startswith(".") and entry.is_dir(follow_symlinks=False)
+            ]
+    except PermissionError:
+        return jsonify({"error": f"Permission denied: {base}"}), 403
+    children.sort(key=lambda e: e.name.casefold())
+
+    dirs = []
+    for entry in children:
+        has_children = False
+        try:
+            # Classic Unix link counting: a directory with exactly
+            # 2 links has no subdirectories, so skip the scandir.
+            # (btrfs reports 1 — fall through and scan.)
+            if entry.stat(follow_symlinks=False).st_nlink != 2:
+                with os.scandir(entry.path) as it:
                     has_children = any(
                         e.is_dir(follow_symlinks=False)
-                        for e in os.scandir(entry.path)
+                        for e in it
                         if not e.name.startswith(".")
                     )
-                except PermissionError:
-                    pass
-                dirs.append({
-                    "name": entry.name,
-                    "path": entry.path,
-                    "has_children": has_children,
-                })
-    except PermissionError:
-        return jsonify({"error": f"Permission denied: {base}"}), 403
+        except (PermissionError, OSError):
+            pass
+        dirs.append({
+            "name": entry.name,
+            "path": entry.path,
+            "has_children": has_children,
+        })
 
     # Detect parent directory
     parent = os.path.dirname(base) if base != "/" else None
@@ -402,24 +615,30 @@ def api_browse():
     })
 
 
+# Scanning the project roots for git repos costs hundreds of stats on
+# repo-heavy homes; the picker re-requests it constantly, so serve a
+# snapshot for a short TTL.
+_recent_cache = {"ts": 0.0, "payload": None}
+_RECENT_TTL = 30.0
+
+# Shortcut candidates never change at runtime — built once, not per call.
+_SHORTCUT_CANDIDATES = [HOME_STR] + [
+    os.path.join(HOME_STR, d)
+    for d in ["Projets", "Projects", "projects", "Bureau", "Desktop",
+              "Documents", "dev", "src", "work"]
+]
+
+
 @app.route("/api/recent-dirs", methods=["GET"])
 def api_recent_dirs():
     """Return common project directories (home, Projets, Desktop, etc.)."""
-    home = str(Path.home())
-    candidates = [
-        home,
-        os.path.join(home, "Projets"),
-        os.path.join(home, "Projects"),
-        os.path.join(home, "projects"),
-        os.path.join(home, "Bureau"),
-        os.path.join(home, "Desktop"),
-        os.path.join(home, "Documents"),
-        os.path.join(home, "dev"),
-        os.path.join(home, "src"),
-        os.path.join(home, "work"),
-    ]
+    if _recent_cache["payload"] is not None and \
+            time.monotonic() - _recent_cache["ts"] < _RECENT_TTL:
+        return jsonify(_recent_cache["payload"])
+
+    home = HOME_STR
     shortcuts = []
-    for p in candidates:
+    for p in _SHORTCUT_CANDIDATES:
         if os.path.isdir(p):
             shortcuts.append({"name": os.path.basename(p) or "~", "path": p})
 
@@ -427,20 +646,33 @@ def api_recent_dirs():
     git_dirs = []
     for base in [os.path.join(home, d) for d in ["Projets", "Projects", "projects", "dev", "src", "work"]]:
         if os.path.isdir(base):
+            base_name = os.path.basename(base)
             for entry in os.scandir(base):
                 if entry.is_dir(follow_symlinks=False):
-                    if os.path.isdir(os.path.join(entry.path, ".git")):
-                        git_dirs.append({"name": f"{os.path.basename(base)}/{entry.name}", "path": entry.path})
+                    # One lstat probe; a .git *file* (worktree/submodule
+                    # checkout) counts as a repo too, which isdir missed.
+                    try:
+                        os.lstat(entry.path + "/.git")
+                    except OSError:
+                        continue
+                    git_dirs.append({"name": f"{base_name}/{entry.name}", "path": entry.path})
 
-    return jsonify({"shortcuts": shortcuts, "projects": git_dirs[:20]})
+    payload = {"shortcuts": shortcuts, "projects": git_dirs[:20]}
+    _recent_cache["payload"] = payload
+    _recent_cache["ts"] = time.monotonic()
+    return jsonify(payload)
 
 
 # ── Terminal WebSocket ────────────────────────────────────────────────────
 
 def _cleanup_terminal(sid):
-    term = _terminals.pop(sid, None)
+    with _terminals_lock:
+        term = _terminals.pop(sid, None)
+        _fd_by_sid.pop(sid, None)
     if not term:
         return
+    if _unregister_pty(term["fd"]) is not None:
+        socketio.emit("terminal_exit", room=sid)
     try:
         os.close(term["fd"])
     except OSError:
@@ -455,13 +687,109 @@ def _cleanup_terminal(sid):
         pass
 
 
+# One dispatcher thread multiplexes every active PTY through a single
+# level-triggered selector (epoll on Linux, kqueue on macOS/BSD), instead
+# of one blocking reader thread per session. With K terminals open this
+# is 1 thread instead of K, and idle sessions cost nothing between
+# wakeups.
+_pty_sel = selectors.DefaultSelector()
+_pty_fds = {}  # fd -> sid
+_PTY_MAX_FRAME = 1 << 20  # per-wakeup coalesce cap (1 MB)
+_pty_lock = threading.Lock()
+_pty_thread = None
+
+
+def _register_pty(sid, fd):
+    global _pty_thread
+    os.set_blocking(fd, False)
+    with _pty_lock:
+        _pty_fds[fd] = sid
+        # Level-triggered: if a frame-size cap stops a drain early, the
+        # next poll fires immediately instead of waiting for a new edge.
+        # Hangups surface as read-readiness (read returns 0/EIO).
+        _pty_sel.register(fd, selectors.EVENT_READ)
+        if _pty_thread is None or not _pty_thread.is_alive():
+            _pty_thread = threading.Thread(target=_pty_dispatch_loop, daemon=True)
+            _pty_thread.start()
+
+
+def _unregister_pty(fd):
+    """Remove a PTY from the dispatcher. Must run before the fd is closed."""
+    with _pty_lock:
+        sid = _pty_fds.pop(fd, None)
+        if sid is not None:
+            try:
+                _pty_sel.unregister(fd)
+            except KeyError:
+                pass
+    return sid
+
+
+def _pty_dispatch_loop():
+    # Scratch buffer reused for every read — os.read allocates a fresh
+    # bytes object per call, os.readv fills this one in place. Safe
+    # without a lock: only this thread touches it.
+    scratch = bytearray(65536)
+    scratch_mv = memoryview(scratch)
+    global _pty_thread
+    while True:
+        with _pty_lock:
+            if not _pty_fds:
+                # Clear the handle before returning, still under the lock:
+                # a register racing with this exit must see None and start
+                # a fresh dispatcher, not find a thread that is about to
+                # die and leave its fd unserviced.
+                _pty_thread = None
+                return  # last session closed; relaunched on next register
+        for key, _ in _pty_sel.select(timeout=1.0):
+            fd = key.fd
+            sid = _pty_fds.get(fd)
+            if sid is None:
+                continue
+            # Coalesce everything available into one frame: bulk output
+            # (build logs, pagers) produces many small reads, and a
+            # WebSocket frame + decode per read is the dominant cost.
+            # Capped at 1 MB so a runaway printer can't grow the buffer
+            # without bound — the remainder is picked up on the next
+            # (level-triggered) poll, after the emit has drained.
+            buf = bytearray()
+            eof = False
+            try:
+                while len(buf) < _PTY_MAX_FRAME:
+                    n = os.readv(fd, (scratch_mv,))
+                    if n == 0:
+                        eof = True
+                        break
+                    buf += scratch_mv[:n]
+            except BlockingIOError:
+                pass  # drained — wait for the next poll
+            except OSError:
+                eof = True
+            if buf:
+                # Raw bytes go out as a binary Socket.IO frame; xterm.js
+                # decodes UTF-8 itself (and buffers split sequences), so
+                # the Python-side decode/str allocation disappears.
+                socketio.emit("terminal_output", bytes(buf), room=sid)
+            if eof:
+                _unregister_pty(fd)
+                # Reap the child now rather than leaving a zombie until
+                # the client disconnects and _cleanup_terminal runs.
+                term = _terminals.get(sid)
+                if term:
+                    try:
+                        os.waitpid(term["pid"], os.WNOHANG)
+                    except (OSError, ChildProcessError):
+                        pass
+                socketio.emit("terminal_exit", room=sid)
+
+
 @socketio.on("connect")
 def handle_ws_connect():
     """Reject unauthenticated WebSocket connections."""
     if not session.get("authenticated"):
         # Check API token in query string
         token = request.args.get("token", "")
-        if not token or not db.verify_api_token(token):
+        if not token or not _check_api_token(token):
             disconnect()
             return False
 
@@ -488,9 +816,9 @@ def handle_start_terminal(data):
     env.setdefault("TERM", "xterm-256color")
 
     # Working directory
-    cwd = data.get("cwd", "") or str(Path.home())
+    cwd = data.get("cwd", "") or HOME_STR
     if not os.path.isdir(cwd):
-        cwd = str(Path.home())
+        cwd = HOME_STR
 
     pid, fd = pty.fork()
     if pid == 0:
@@ -499,29 +827,11 @@ def handle_start_terminal(data):
         os.execvpe("claude", ["claude"], env)
     else:
         # Parent — track and relay
-        _terminals[sid] = {"fd": fd, "pid": pid}
+        with _terminals_lock:
+            _terminals[sid] = {"fd": fd, "pid": pid}
+            _fd_by_sid[sid] = fd
         emit("terminal_started")
-
-        def _read_loop():
-            while sid in _terminals:
-                try:
-                    r, _, _ = select.select([fd], [], [], 0.1)
-                    if r:
-                        chunk = os.read(fd, 4096)
-                        if chunk:
-                            socketio.emit(
-                                "terminal_output",
-                                {"data": chunk.decode("utf-8", errors="replace")},
-                                room=sid,
-                            )
-                        else:
-                            break
-                except (OSError, IOError):
-                    break
-            socketio.emit("terminal_exit", room=sid)
-
-        t = threading.Thread(target=_read_loop, daemon=True)
-        t.start()
+        _register_pty(sid, fd)
 
 
 @socketio.on("start_login")
@@ -550,12 +860,12 @@ def handle_start_login(data):
     env.setdefault("TERM", "xterm-256color")
 
     # Working directory
-    cwd = data.get("cwd", "") or str(Path.home())
+    cwd = data.get("cwd", "") or HOME_STR
     if not os.path.isdir(cwd):
-        cwd = str(Path.home())
+        cwd = HOME_STR
 
     # Snapshot the credentials file mtime before launching
-    cred_path = Path.home() / ".claude" / ".credentials.json"
+    cred_path = CREDENTIALS_PATH
     initial_mtime = cred_path.stat().st_mtime if cred_path.exists() else 0
 
     pid, fd = pty.fork()
@@ -564,66 +874,75 @@ def handle_start_login(data):
         os.chdir(cwd)
         os.execvpe("claude", ["claude"], env)
     else:
-        _terminals[sid] = {"fd": fd, "pid": pid, "login_account": account_id}
+        with _terminals_lock:
+            _terminals[sid] = {"fd": fd, "pid": pid, "login_account": account_id}
+            _fd_by_sid[sid] = fd
         emit("terminal_started")
 
-        def _read_loop():
-            while sid in _terminals:
-                try:
-                    r, _, _ = select.select([fd], [], [], 0.1)
-                    if r:
-                        chunk = os.read(fd, 4096)
-                        if chunk:
-                            socketio.emit(
-                                "terminal_output",
-                                {"data": chunk.decode("utf-8", errors="replace")},
-                                room=sid,
-                            )
-                        else:
-                            break
-                except (OSError, IOError):
-                    break
-            socketio.emit("terminal_exit", room=sid)
-
         def _watch_credentials():
-            """Poll .credentials.json for new/updated tokens."""
+            """Poll .credentials.json for new/updated tokens.
+
+            Stays a poll loop (the stdlib has no inotify binding and this
+            repo avoids extra dependencies), but each tick is a single
+            stat syscall and the interval is short enough that login
+            detection feels immediate.
+
+            Gives up after _WATCH_DEADLINE so an abandoned login terminal
+            can't hold a pool slot forever — with max_workers watchers
+            wedged, later logins would never get their tokens captured.
+            """
+            cred_path_str = str(cred_path)
             mtime_ref = initial_mtime
-            while sid in _terminals:
+            deadline = _time.monotonic() + _WATCH_DEADLINE
+            while sid in _terminals and _time.monotonic() < deadline:
                 try:
-                    if cred_path.exists():
-                        cur = cred_path.stat().st_mtime
-                        if cur > mtime_ref:
-                            _time.sleep(0.5)  # let claude finish writing
-                            try:
-                                result = db.capture_oauth_tokens(account_id)
-                                socketio.emit("login_complete", {
-                                    "account_id": account_id,
-                                    "token_preview": result["token_preview"],
-                                    "has_refresh": result["has_refresh"],
-                                    "expires_in_min": result["expires_in_min"],
-                                }, room=sid)
-                                return  # tokens captured
-                            except Exception:
-                                mtime_ref = cur
+                    cur = os.stat(cred_path_str).st_mtime
+                    if cur > mtime_ref:
+                        _time.sleep(0.5)  # let claude finish writing
+                        try:
+                            result = db.capture_oauth_tokens(account_id)
+                            socketio.emit("login_complete", {
+                                "account_id": account_id,
+                                "token_preview": result["token_preview"],
+                                "has_refresh": result["has_refresh"],
+                                "expires_in_min": result["expires_in_min"],
+                            }, room=sid)
+                            return  # tokens captured
+                        except Exception:
+                            mtime_ref = cur
                 except (OSError, IOError):
                     pass
-                _time.sleep(2)
+                _time.sleep(0.5)
 
-        t1 = threading.Thread(target=_read_loop, daemon=True)
-        t2 = threading.Thread(target=_watch_credentials, daemon=True)
-        t1.start()
-        t2.start()
+        _register_pty(sid, fd)
+        _watch_pool.submit(_watch_credentials)
 
 
 @socketio.on("terminal_input")
 def handle_terminal_input(data):
     from flask import request as freq
-    term = _terminals.get(freq.sid)
-    if term:
-        try:
-            os.write(term["fd"], data["data"].encode("utf-8"))
-        except (OSError, IOError):
-            pass
+    fd = _fd_by_sid.get(freq.sid)
+    if fd is None:
+        return
+    # Binary frames (bulk pastes) skip the UTF-8 encode entirely; text
+    # frames (keystrokes) still pay it, but it's one tiny string.
+    raw = data["data"]
+    if not isinstance(raw, (bytes, bytearray)):
+        raw = raw.encode("utf-8")
+    # The master fd is non-blocking (see _register_pty): a bulk paste can
+    # overrun the PTY buffer and raise BlockingIOError mid-write. Write
+    # from a memoryview and wait for writability instead of dropping the
+    # remainder of the user's input.
+    mv = memoryview(raw)
+    try:
+        while mv:
+            try:
+                n = os.write(fd, mv)
+                mv = mv[n:]
+            except BlockingIOError:
+                select.select([], [fd], [], 0.05)
+    except (OSError, IOError):
+        pass
 
 
 @socketio.on("resize_terminal")
@@ -661,7 +980,9 @@ def index():
 
 @app.route("/<path:path>")
 def static_files(path):
-    return send_from_directory("static", path)
+    # Assets other than the app shell can live in the browser cache for an
+    # hour; send_from_directory already answers conditional GETs with 304.
+    return send_from_directory("static", path, max_age=3600)
 
 
 def start_server(host="127.0.0.1", port=5111, open_browser=True):